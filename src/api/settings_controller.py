@@ -5,63 +5,75 @@ Controller for settings-related API endpoints.
 import structlog
 from typing import Dict, Any
 from flask import request
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 
 from services.settings_service import settings_service
+from utils.error_handlers import log_and_reraise
 from utils.exceptions import ValidationError, ConfigurationError
 
 logger = structlog.get_logger()
 
+# Structural validation is compiled once at import time; the numeric
+# fields keep coercion checks in _validate_settings because clients send
+# them both as numbers and as strings
+_SETTINGS_SCHEMA = {
+    "type": "object",
+    "required": ["printer_uri", "printer_model", "label_size"],
+    "properties": {
+        "alignment": {"enum": ["left", "center", "right"]},
+        "printers": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "printer_uri", "printer_model", "label_size"],
+            },
+        },
+    },
+}
+_SETTINGS_VALIDATOR = Draft7Validator(_SETTINGS_SCHEMA)
+
+@log_and_reraise(ConfigurationError, "Error getting settings")
 def get_settings() -> Dict[str, Any]:
     """
     Get current settings.
-    
+
     Returns:
         Dict containing the current settings.
     """
-    try:
-        logger.info("Getting current settings")
-        settings = settings_service.get_settings()
-        return settings
-    except Exception as e:
-        logger.error("Error getting settings", error=str(e), exc_info=True)
-        raise ConfigurationError(f"Error getting settings: {str(e)}")
+    logger.debug("Getting current settings")
+    return settings_service.get_settings()
 
+@log_and_reraise(ConfigurationError, "Error updating settings")
 def update_settings() -> Dict[str, Any]:
     """
     Update settings.
-    
+
     Returns:
         Dict containing the result of the update operation.
     """
-    try:
-        logger.info("Updating settings")
-        
-        # Get settings from request body
-        settings = request.get_json()
-        if not settings:
-            raise ValidationError("No settings provided", "settings")
-        
-        # Validate settings
-        _validate_settings(settings)
-        
-        # Update settings
-        success = settings_service.update_settings(settings)
-        
-        if success:
-            logger.info("Settings updated successfully")
-            return {
-                "success": True,
-                "message": "Settings updated successfully"
-            }
-        else:
-            logger.error("Failed to update settings")
-            raise ConfigurationError("Failed to update settings")
-    except ValidationError as e:
-        logger.error("Validation error", error=str(e), exc_info=True)
-        raise
-    except Exception as e:
-        logger.error("Error updating settings", error=str(e), exc_info=True)
-        raise ConfigurationError(f"Error updating settings: {str(e)}")
+    logger.debug("Updating settings")
+
+    # Get settings from request body
+    settings = request.get_json()
+    if not settings:
+        raise ValidationError("No settings provided", "settings")
+
+    # Validate settings
+    _validate_settings(settings)
+
+    # Update settings
+    success = settings_service.update_settings(settings)
+
+    if success:
+        logger.info("Settings updated successfully")
+        return {
+            "success": True,
+            "message": "Settings updated successfully"
+        }
+    else:
+        logger.error("Failed to update settings")
+        raise ConfigurationError("Failed to update settings")
 
 def _validate_settings(settings: Dict[str, Any]) -> None:
     """
@@ -73,16 +85,22 @@ def _validate_settings(settings: Dict[str, Any]) -> None:
     Raises:
         ValidationError: If settings are invalid.
     """
-    # Check required fields
-    required_fields = ["printer_uri", "printer_model", "label_size"]
-    for field in required_fields:
-        if field not in settings:
-            raise ValidationError(f"Missing required setting: {field}", field)
-    
-    # Validate alignment
-    if "alignment" in settings and settings["alignment"] not in ["left", "center", "right"]:
-        raise ValidationError(f"Invalid alignment value: {settings['alignment']}", "alignment")
-    
+    # Required fields, alignment enum and printers[] shape are covered by
+    # the precompiled schema validator
+    error = best_match(_SETTINGS_VALIDATOR.iter_errors(settings))
+    if error is not None:
+        path = list(error.absolute_path)
+        if error.validator == "required":
+            missing = error.message.split("'")[1]
+            if path:
+                raise ValidationError(f"Printer missing required field: {missing}",
+                                      f"printers[{path[1]}].{missing}")
+            raise ValidationError(f"Missing required setting: {missing}", missing)
+        if len(path) == 2 and path[0] == "printers":
+            raise ValidationError("Printer must be a dictionary", f"printers[{path[1]}]")
+        field = str(path[0]) if path else "settings"
+        raise ValidationError(f"Invalid {field} value: {error.instance}", field)
+
     # Validate rotate
     if "rotate" in settings:
         try:
@@ -100,13 +118,3 @@ def _validate_settings(settings: Dict[str, Any]) -> None:
                 raise ValidationError(f"Invalid threshold value: {threshold}", "threshold")
         except (ValueError, TypeError):
             raise ValidationError(f"Invalid threshold value: {settings['threshold']}", "threshold")
-    
-    # Validate printers
-    if "printers" in settings and isinstance(settings["printers"], list):
-        for i, printer in enumerate(settings["printers"]):
-            if not isinstance(printer, dict):
-                raise ValidationError(f"Printer must be a dictionary", f"printers[{i}]")
-            
-            for field in ["id", "printer_uri", "printer_model", "label_size"]:
-                if field not in printer:
-                    raise ValidationError(f"Printer missing required field: {field}", f"printers[{i}].{field}")
@@ -6,51 +6,76 @@ import structlog
 from typing import Dict, Any
 
 from services.printer_service import printer_service
-from utils.exceptions import ValidationError, PrinterError, ResourceNotFoundError
+from utils.error_handlers import log_and_reraise
+from utils.exceptions import ValidationError, PrinterError
 
 logger = structlog.get_logger()
 
+# Settings every print request must carry, checked with one set difference
+# instead of a per-field .get() chain
+_REQUIRED_SETTINGS = frozenset({"printer_uri", "printer_model", "label_size"})
+
+@log_and_reraise(PrinterError, "Error printing text")
 def print_text(body: Dict[str, Any]) -> Dict[str, Any]:
     """
     Print text on a label.
-    
+
     Args:
         body: Dict containing text and print settings.
-        
+
     Returns:
         Dict containing the result of the print operation.
     """
-    try:
-        logger.info("Processing text print request")
-        
-        # Extract and validate parameters
-        text = body.get("text")
-        settings = body.get("settings", {})
-        
-        if not text:
-            raise ValidationError("text is required", "text")
-        if not settings:
-            raise ValidationError("settings is required", "settings")
-        
-        # Validate required settings
-        required_settings = ["printer_uri", "printer_model", "label_size"]
-        for setting in required_settings:
-            if setting not in settings:
-                raise ValidationError(f"{setting} is required", f"settings.{setting}")
-        
-        # Print text
-        result = printer_service.print_text(text, settings)
-        
-        return result
-    except ValidationError as e:
-        logger.error("Validation error", error=str(e), exc_info=True)
-        raise
-    except PrinterError as e:
-        logger.error("Printer error", error=str(e), exc_info=True)
-        raise
-    except ResourceNotFoundError as e:
-        logger.error("Resource not found", error=str(e), exc_info=True)
-        raise
-    except Exception as e:
-        logger.error("Error printing text", error=str(e), exc_info=True)
-        raise PrinterError(f"Error printing text: {str(e)}")
+    logger.debug("Processing text print request")
+
+    # Extract and validate parameters
+    text = body.get("text")
+    settings = body.get("settings", {})
+
+    if not text:
+        raise ValidationError("text is required", "text")
+    if not settings:
+        raise ValidationError("settings is required", "settings")
+
+    # Validate required settings
+    missing = _REQUIRED_SETTINGS.difference(settings)
+    if missing:
+        setting = sorted(missing)[0]
+        raise ValidationError(f"{setting} is required", f"settings.{setting}")
+
+    # Print text
+    return printer_service.print_text(text, settings)
+
+@log_and_reraise(PrinterError, "Error printing text batch")
+def print_text_batch(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Print multiple text labels in one request.
+
+    All labels share one settings block and are shipped over a single
+    printer connection instead of one session per label.
+
+    Args:
+        body: Dict containing a list of texts and shared print settings.
+
+    Returns:
+        Dict containing the result of the batch submission.
+    """
+    logger.debug("Processing text batch print request")
+
+    # Extract and validate parameters
+    texts = body.get("texts")
+    settings = body.get("settings", {})
+
+    if not texts:
+        raise ValidationError("texts is required and must not be empty", "texts")
+    if not settings:
+        raise ValidationError("settings is required", "settings")
+
+    # Validate required settings
+    missing = _REQUIRED_SETTINGS.difference(settings)
+    if missing:
+        setting = sorted(missing)[0]
+        raise ValidationError(f"{setting} is required", f"settings.{setting}")
+
+    # Print the batch
+    return printer_service.print_text_batch(texts, settings)
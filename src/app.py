@@ -1,16 +1,43 @@
+import atexit
+import functools
 import os
+import queue
+import sys
 import connexion
 import logging
 import structlog
+from logging.handlers import QueueHandler, QueueListener
+from connexion.decorators.validation import RequestBodyValidator, ResponseBodyValidator
 from flask_cors import CORS
 from pathlib import Path
 
+# Optional: serialize JSON responses with orjson's C encoder. Needs both
+# orjson and the provider API added in Flask 2.2 (our pin spans 2.0-2.2).
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    ORJSON_PROVIDER_AVAILABLE = True
+except ImportError:
+    ORJSON_PROVIDER_AVAILABLE = False
+
 from src.utils.error_handlers import register_error_handlers
 from src.utils.pillow_patch import apply_pillow_patch
 from src.services.printer_service import printer_service
 from src.services.settings_service import settings_service
 
-# Configure structured logging
+# Configure structured logging. The expensive steps (traceback formatting,
+# JSON rendering) live in the ProcessorFormatter attached to the queue
+# listener below, so request threads only enqueue a lightweight record.
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
@@ -18,10 +45,8 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -29,37 +54,143 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
+class _PassthroughQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The stock prepare() formats the record eagerly on the calling thread;
+    since nothing is pickled here, hand the record over untouched and let
+    the listener's formatter do the work off-thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+_log_listener = None
+
+def _init_log_pipeline():
+    """Move log formatting and emission off the request threads."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    # Render the final JSON with orjson when available; the listener's
+    # formatter must return str, so decode the bytes it produces
+    if ORJSON_PROVIDER_AVAILABLE:
+        json_renderer = structlog.processors.JSONRenderer(
+            serializer=lambda obj, **kw: orjson.dumps(obj).decode())
+    else:
+        json_renderer = structlog.processors.JSONRenderer()
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            json_renderer,
+        ],
+    ))
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    # The queue handler replaces any direct stream handlers so each record
+    # is emitted exactly once, by the listener thread
+    root.handlers = [_PassthroughQueueHandler(log_queue)]
+
+    _log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 # Set root logger level to DEBUG to capture all messages
 #logging.basicConfig(level=logging.DEBUG, format='%(message)s') # Basic config for root logger
 
 # Create logger
 logger = structlog.get_logger()
 
-# Constants
+# Constants — environment flags and derived paths are resolved once at
+# import so each worker fork pays for them a single time
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads")
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+
+@functools.lru_cache(maxsize=1)
+def _ensure_upload_folder() -> str:
+    """Create the upload folder exactly once per process."""
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    return UPLOAD_FOLDER
+
+DATA_DIR = "/app/data"  # Consistent with entrypoint and settings_service
+INIT_FLAG_FILE = os.path.join(DATA_DIR, ".initialized")
+SKIP_INIT_CONFIG = os.environ.get('SKIP_INIT_CONFIG') == 'true'
+DEBUG_MODE = os.environ.get('FLASK_ENV') == 'development' or os.environ.get('FLASK_DEBUG') == '1'
+USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE') == 'true'
+
+# JSON-schema validators are pure functions of their schema dict, which is
+# owned by the spec for the life of the process — build each one once and
+# share it across Connexion's lazily constructed operation decorators
+_validator_cache = {}
+
+class _CachedRequestBodyValidator(RequestBodyValidator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validator = _validator_cache.setdefault(('body', id(self.schema)), self.validator)
+
+class _CachedResponseBodyValidator(ResponseBodyValidator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validator = _validator_cache.setdefault(('response', id(self.schema)), self.validator)
 
 def create_app():
     """Create and configure the Flask application with Connexion."""
-    # Create the connexion application
-    connexion_app = connexion.App(__name__, specification_dir='api/')
+    # Create the connexion application. Mounting the static folder at the
+    # root lets werkzeug's static view serve /css/* and /js/* directly
+    # (with conditional-request and sendfile support) instead of routing
+    # them through Python handlers.
+    connexion_app = connexion.App(__name__, specification_dir='api/',
+                                  server_args={'static_url_path': ''})
     
     # Get the underlying Flask app
     app = connexion_app.app
-    
+
+    # Route log emission through the background listener thread
+    _init_log_pipeline()
+
+    # Ensure Pillow compatibility regardless of entry point (gunicorn
+    # workers never run the __main__ block); the patch itself is cached
+    apply_pillow_patch()
+
     # Configure the app
     app.config.from_mapping(
         SECRET_KEY=os.environ.get('SECRET_KEY', 'dev'),
-        UPLOAD_FOLDER=UPLOAD_FOLDER,
+        UPLOAD_FOLDER=_ensure_upload_folder(),
         MAX_CONTENT_LENGTH=16 * 1024 * 1024,  # 16 MB max upload
     )
     
-    # Enable CORS
-    CORS(app)
+    # All jsonify/request.get_json calls go through orjson when available;
+    # no call-site changes needed
+    if ORJSON_PROVIDER_AVAILABLE:
+        app.json = _OrjsonProvider(app)
+
+    # When running behind a front-end that supports X-Sendfile (nginx
+    # X-Accel-Redirect, Apache mod_xsendfile), let it stream static files
+    # via sendfile(2) instead of pushing bytes through Python
+    app.use_x_sendfile = USE_X_SENDFILE
+
+    # Enable CORS. send_wildcard emits a literal 'Access-Control-Allow-
+    # Origin: *' instead of matching and echoing the request origin, so
+    # the extension skips its per-request origin regex walk; fixed method
+    # and header lists keep the response headers constant
+    CORS(app, origins="*", send_wildcard=True,
+         methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+         allow_headers=["Content-Type"])
     
-    # Add the OpenAPI specification
-    connexion_app.add_api('openapi.yaml', 
-                         validate_responses=True,
+    # Add the OpenAPI specification. Response validation re-walks every
+    # response body against its schema; that is a development aid, so only
+    # pay for it in debug mode
+    connexion_app.add_api('openapi.yaml',
+                         validate_responses=DEBUG_MODE,
+                         validator_map={
+                             'body': _CachedRequestBodyValidator,
+                             'response': _CachedResponseBodyValidator,
+                         },
                          options={"swagger_ui": True})
     
     # Register error handlers
@@ -68,37 +199,33 @@ def create_app():
     # Register routes
     register_routes(app)
     
+    # Warm the service singletons (parsed settings, font cache) before the
+    # WSGI server starts accepting connections, so the first request does
+    # not pay initialization costs
+    settings_service.get_settings()
+    printer_service.warm_up()
+
     logger.info("Application initialized successfully")
-    
+
     return connexion_app
 
 # This function is now imported from utils.error_handlers
 
 def register_routes(app):
     """Register additional routes not covered by the OpenAPI specification."""
+    # /css/* and /js/* are handled by the root-mounted static view
     @app.route('/')
     def index():
         return app.send_static_file('index.html')
-    
-    @app.route('/css/<path:filename>')
-    def serve_css(filename):
-        return app.send_static_file(f'css/{filename}')
-    
-    @app.route('/js/<path:filename>')
-    def serve_js(filename):
-        return app.send_static_file(f'js/{filename}')
 
 def init_config():
     """Initialize configuration directories and files if needed."""
     # Check if initialization should be skipped (set by docker-entrypoint.sh)
-    if os.environ.get('SKIP_INIT_CONFIG') == 'true':
+    if SKIP_INIT_CONFIG:
         logger.info("SKIP_INIT_CONFIG is set, assuming entrypoint handled initialization.")
-        
+
         # Verify the initialization flag exists in the correct data directory
-        data_dir = "/app/data" # Consistent with entrypoint and settings_service
-        init_flag_file = os.path.join(data_dir, ".initialized")
-        
-        if os.path.exists(init_flag_file):
+        if os.path.exists(INIT_FLAG_FILE):
             logger.info("Initialization flag found in data directory.")
         else:
             # This case should ideally not happen if the entrypoint runs correctly.
@@ -121,11 +248,10 @@ def init_config():
     logger.warning("Running fallback init_config logic. This should not happen in standard Docker deployment.")
     
     # Example: Ensure data directory exists (though entrypoint should create it)
-    data_dir = "/app/data"
-    if not os.path.exists(data_dir):
+    if not os.path.exists(DATA_DIR):
         try:
-            os.makedirs(data_dir, exist_ok=True)
-            logger.info(f"Created data directory at {data_dir} (fallback).")
+            os.makedirs(DATA_DIR, exist_ok=True)
+            logger.info(f"Created data directory at {DATA_DIR} (fallback).")
         except Exception as e:
             logger.error(f"Failed to create data directory (fallback): {str(e)}")
 
@@ -156,9 +282,10 @@ def init_keep_alive():
         logger.error("Error initializing keep alive", error=str(e), exc_info=True)
 
 if __name__ == '__main__':
-    # Set up logging
-    logging.basicConfig(level=logging.INFO)
-    
+    # Per-request entry logs are emitted at DEBUG; only surface them when
+    # the server actually runs in debug mode
+    logging.basicConfig(level=logging.DEBUG if DEBUG_MODE else logging.INFO)
+
     # Apply Pillow patch for compatibility with newer versions
     apply_pillow_patch()
     
@@ -172,9 +299,21 @@ if __name__ == '__main__':
     init_keep_alive()
     
     # Use Flask's debug setting, which might influence logging levels too
-    # Determine debug mode based on environment variables
-    debug_mode = os.environ.get('FLASK_ENV') == 'development' or os.environ.get('FLASK_DEBUG') == '1'
+    debug_mode = DEBUG_MODE
     # Disable the reloader explicitly to prevent state issues with singletons during development
     use_reloader = False
-    logger.info("Starting Flask app", debug_mode=debug_mode, use_reloader=use_reloader)
-    app.run(host='0.0.0.0', port=5000, debug=debug_mode, use_reloader=use_reloader)
+
+    if debug_mode:
+        logger.info("Starting Flask dev server", debug_mode=debug_mode, use_reloader=use_reloader)
+        app.run(host='0.0.0.0', port=5000, debug=debug_mode, use_reloader=use_reloader)
+    else:
+        # Serve through waitress in production: a real thread pool instead
+        # of Werkzeug's development server, so concurrent print requests
+        # do not serialize on a single thread
+        try:
+            from waitress import serve
+            logger.info("Starting waitress server", threads=8)
+            serve(app.app, host='0.0.0.0', port=5000, threads=8)
+        except ImportError:
+            logger.warning("waitress not installed, falling back to Flask dev server")
+            app.run(host='0.0.0.0', port=5000, debug=debug_mode, use_reloader=use_reloader)
@@ -3,7 +3,22 @@ Default settings for the Brother QL Printer App.
 These settings are used when no user-defined settings are available.
 """
 
-DEFAULT_SETTINGS = {
+from types import MappingProxyType
+
+# Frozen default printer entries; get_defaults() materializes mutable copies
+_DEFAULT_PRINTERS = (
+    MappingProxyType({
+        "id": "default",
+        "name": "Default Printer",
+        "printer_uri": "tcp://192.168.1.100",
+        "printer_model": "QL-800",
+        "label_size": "62"
+    }),
+)
+
+# Read-only view: callers that need a mutable dict must go through
+# get_defaults() instead of deep-copying this mapping
+DEFAULT_SETTINGS = MappingProxyType({
     "printer_uri": "tcp://192.168.1.100",
     "printer_model": "QL-800",
     "label_size": "62",
@@ -16,13 +31,17 @@ DEFAULT_SETTINGS = {
     "red": False,
     "keep_alive_enabled": False,
     "keep_alive_interval": 60,  # seconds
-    "printers": [
-        {
-            "id": "default",
-            "name": "Default Printer",
-            "printer_uri": "tcp://192.168.1.100",
-            "printer_model": "QL-800",
-            "label_size": "62"
-        }
-    ]
-}
+    "printers": _DEFAULT_PRINTERS
+})
+
+def get_defaults():
+    """
+    Return a fresh, fully mutable copy of the default settings.
+
+    A top-level dict() plus rebuilding the small printers list is much
+    cheaper than deep-copying a nested structure, and the frozen source
+    cannot be corrupted by callers.
+    """
+    defaults = dict(DEFAULT_SETTINGS)
+    defaults["printers"] = [dict(printer) for printer in _DEFAULT_PRINTERS]
+    return defaults
@@ -3,19 +3,42 @@ Printer service for managing Brother QL printer operations.
 """
 
 import os
+import re
 import sys
-import uuid
+import html
+import itertools
+import atexit
+import hashlib
 import structlog
 import threading
 import time
+import queue
 import socket
+import selectors
+import errno
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
+import PIL
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 import qrcode
 from brother_ql.raster import BrotherQLRaster
 from brother_ql.conversion import convert
 from brother_ql.backends import backend_factory, guess_backend
 
+# Import numpy for vectorized image thresholding
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Import lxml for fast C-level parsing of the label markup
+try:
+    import lxml.html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 # Import pysnmp for SNMP-based printer communication
 try:
     from pysnmp.hlapi import (
@@ -33,6 +56,229 @@ from src.utils.exceptions import PrinterError, ImageProcessingError
 
 logger = structlog.get_logger()
 
+# Pillow-SIMD is a drop-in replacement that accelerates the resize/rotate
+# resampling kernels with SSE4/AVX2 (install via
+# `pip uninstall Pillow && pip install pillow-simd`). Its version string
+# carries a ".postN" suffix; log which implementation is active.
+if ".post" in getattr(PIL, "__version__", ""):
+    logger.info("Pillow-SIMD detected, using SIMD resampling kernels", pillow_version=PIL.__version__)
+else:
+    logger.debug("Standard Pillow in use", pillow_version=getattr(PIL, "__version__", "unknown"))
+
+@lru_cache(maxsize=8)
+def _backend_class(backend_type: str):
+    """
+    Resolve a brother_ql backend class once per backend identifier.
+
+    backend_factory performs module discovery on every call; the result
+    never changes within a process, so bind it once.
+    """
+    return backend_factory(backend_type)["backend_class"]
+
+# Job identifiers only need to be unique within this process; a counter
+# scoped by PID avoids the urandom syscall uuid4 pays per job
+_job_counter = itertools.count()
+_JOB_PREFIX = f"{os.getpid():x}"
+
+def _next_job_id(kind: str) -> str:
+    """Return a process-unique job identifier like 'text_a1b200000003'."""
+    return f"{kind}_{_JOB_PREFIX}{next(_job_counter):08x}"
+
+_FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf",
+    "/Library/Fonts/DejaVuSans-Bold.ttf",
+    "C:\\Windows\\Fonts\\DejaVuSans-Bold.ttf",
+)
+
+@lru_cache(maxsize=1)
+def _resolve_font() -> Optional[str]:
+    """
+    Resolve the label font path once per process.
+
+    Probes a short list of known DejaVu locations with os.path.isfile,
+    then asks fontconfig's fc-match — a millisecond subprocess, versus
+    the matplotlib.font_manager import the fallback used to pull in,
+    which scans every installed font and holds tens of MB of RSS.
+    """
+    for candidate in _FONT_CANDIDATES:
+        if os.path.isfile(candidate):
+            return candidate
+    try:
+        import subprocess
+        result = subprocess.run(
+            ["fc-match", "-f", "%{file}", "DejaVu Sans:bold"],
+            capture_output=True, text=True, timeout=1,
+        )
+        path = result.stdout.strip()
+        if path and os.path.isfile(path):
+            logger.info("Using font", font_path=path)
+            return path
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+        pass
+    logger.warning("No suitable font found, using default font")
+    return None
+
+@lru_cache(maxsize=128)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, caching instances per (path, size).
+
+    ImageFont.truetype re-parses the font file on every call, which is
+    wasteful when the same font and size are used for every label.
+
+    Args:
+        path: Path to the TrueType font file.
+        size: Font size in points.
+
+    Returns:
+        A cached FreeTypeFont instance.
+    """
+    return ImageFont.truetype(path, size)
+
+@lru_cache(maxsize=128)
+def _get_font_metrics(path: str, size: int) -> Tuple[int, int]:
+    """
+    Return the (ascent, descent) metrics for a font, cached per (path, size).
+
+    Metrics depend only on the font face and size, so there is no need
+    to round-trip through FreeType for every line.
+
+    Args:
+        path: Path to the TrueType font file.
+        size: Font size in points.
+
+    Returns:
+        Tuple of (ascent, descent) in pixels.
+    """
+    return _get_font(path, size).getmetrics()
+
+@lru_cache(maxsize=1024)
+def _measure_line(path: str, size: int, text: str) -> Tuple[int, int]:
+    """
+    Measure the rendered width and height of a line of text.
+
+    Uses font.getlength, which only runs FreeType's horizontal layout
+    and is considerably faster than textbbox/getbbox for width-only
+    measurement. Line height comes from the font metrics so it is
+    uniform across lines. Results are memoized so that repeat prints of
+    the same label (or repeated lines within one label) skip Pillow's
+    text layout entirely.
+
+    Args:
+        path: Path to the TrueType font file.
+        size: Font size in points.
+        text: The line of text to measure.
+
+    Returns:
+        Tuple of (width, height) in pixels.
+    """
+    font = _get_font(path, size)
+    ascent, descent = _get_font_metrics(path, size)
+    return int(font.getlength(text)), ascent + descent
+
+def _binarize(img: Image.Image, threshold: float) -> Image.Image:
+    """
+    Threshold an image to 1-bit black/white in one vectorized pass.
+
+    Applies the same cutoff brother_ql's convert() would use, so passing
+    the result (mode "1") into convert() skips its own per-pixel
+    thresholding step.
+
+    Args:
+        img: Source image.
+        threshold: Threshold percentage (0-100), brother_ql convention.
+
+    Returns:
+        The thresholded image in mode "1".
+    """
+    cutoff = min(255, max(0, int((100.0 - threshold) / 100.0 * 255)))
+    arr = np.asarray(img.convert("L"))
+    return Image.fromarray(arr >= cutoff)
+
+def _image_digest(image) -> Tuple:
+    """
+    Return a content digest for a label image or image file.
+
+    Args:
+        image: A PIL Image or a path to an image file.
+
+    Returns:
+        A hashable tuple identifying the image content.
+    """
+    if isinstance(image, Image.Image):
+        return (
+            hashlib.blake2b(image.tobytes(), digest_size=16).hexdigest(),
+            image.mode, image.size,
+        )
+    with open(image, "rb") as f:
+        return (hashlib.blake2b(f.read(), digest_size=16).hexdigest(),)
+
+def _rotate_image(img: Image.Image, angle: int) -> Image.Image:
+    """
+    Rotate an image in memory.
+
+    Cardinal angles use an exact pixel transpose; arbitrary angles fall
+    back to the Lanczos resampler. The signs mirror rotate(-angle).
+
+    Args:
+        img: Source image.
+        angle: Rotation angle in degrees.
+
+    Returns:
+        The rotated image (the input if the angle is zero).
+    """
+    angle %= 360
+    if angle == 0:
+        return img
+
+    transpose_map = {
+        90: Image.Transpose.ROTATE_270,
+        180: Image.Transpose.ROTATE_180,
+        270: Image.Transpose.ROTATE_90,
+    }
+    method = transpose_map.get(angle)
+    if method is not None:
+        return img.transpose(method)
+    return img.rotate(-angle, resample=Image.Resampling.LANCZOS, expand=True)
+
+# The label markup grammar is tiny: <br> breaks lines, any other tag is
+# stripped. Two precompiled patterns handle it in a single C-level pass.
+_BR_TAG = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_OTHER_TAG = re.compile(r"<[^>]*>")
+
+# tcp://<host>[:port] — captures the host, discards the optional port
+_TCP_URI_RE = re.compile(r"^tcp://(?P<ip>[^:/\s]+)(?::\d+)?/?$")
+
+@lru_cache(maxsize=256)
+def _parse_label_lines(html_text: str) -> Tuple[str, ...]:
+    """
+    Split label markup into lines of plain text, breaking at <br> tags.
+
+    Uses lxml's C parser when available; falls back to a precompiled
+    regex scanner otherwise. Results are memoized since the same label
+    text is frequently reprinted.
+
+    Args:
+        html_text: Text to print (can include HTML formatting).
+
+    Returns:
+        Tuple of text lines.
+    """
+    if LXML_AVAILABLE:
+        root = lxml_html.fromstring(f"<div>{html_text}</div>")
+        for br in root.iter("br"):
+            br.tail = "\n" + (br.tail or "")
+        lines = root.text_content().split("\n")
+    else:
+        lines = [html.unescape(_OTHER_TAG.sub("", chunk))
+                 for chunk in _BR_TAG.split(html_text)]
+
+    # A trailing <br> should not produce an extra empty line
+    if lines and not lines[-1]:
+        lines.pop()
+    return tuple(lines)
+
 class PrinterService:
     """Service for managing Brother QL printer operations."""
     
@@ -46,6 +292,48 @@ class PrinterService:
         # Keep alive thread
         self.keep_alive_thread = None
         self.keep_alive_stop_event = threading.Event()
+
+        # Cache of rendered text labels keyed by (text, font_size, alignment)
+        self._text_label_cache: Dict[Tuple[str, int, str], Image.Image] = {}
+
+        # Cache of composed QR code images keyed by payload and layout
+        self._qr_label_cache: Dict[Tuple, Image.Image] = {}
+
+        # Cache of rasterized printer instructions keyed by image content
+        # hash and conversion settings, so repeat prints skip convert()
+        self._raster_cache: Dict[Tuple, bytes] = {}
+
+        # Persistent printer connection (network backend only), so repeat
+        # prints reuse one TCP connection instead of reconnecting per label
+        self._backend = None
+        self._backend_uri: Optional[str] = None
+        self._backend_lock = threading.Lock()
+        atexit.register(self._close_backend)
+
+        # Background print queue: labels are rendered on the request
+        # thread, transmission to the printer is serialized on a worker
+        # thread so HTTP requests do not block on the printer I/O
+        self._print_queue: queue.Queue = queue.Queue()
+        self._print_worker = threading.Thread(target=self._print_worker_loop, daemon=True)
+        self._print_worker.start()
+
+        # Keys of jobs currently queued or printing, used to coalesce
+        # identical concurrent print requests
+        self._pending_jobs: set = set()
+        self._pending_lock = threading.Lock()
+
+        # pysnmp engine and request objects, built lazily on the first
+        # ping and reused afterwards — engine construction loads the MIB
+        # machinery and dominates the cost of a single SNMP GET
+        self._snmp_engine = None
+        self._snmp_community = None
+        self._snmp_context = None
+        self._snmp_object = None
+        self._snmp_transports: Dict[str, Any] = {}
+
+        # Which keep-alive probe answered last, per printer address, so
+        # steady state is one attempt instead of the full cascade
+        self._ping_pref: Dict[str, str] = {}
         if upload_folder is None:
             self.upload_folder = os.path.join(
                 os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -57,22 +345,33 @@ class PrinterService:
         # Ensure upload folder exists
         os.makedirs(self.upload_folder, exist_ok=True)
         
-        # Font path for text rendering
-        self.font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-        if not os.path.exists(self.font_path):
-            # Try to find a suitable font on the system
-            try:
-                import matplotlib.font_manager as fm
-                self.font_path = fm.findfont(fm.FontProperties(family='DejaVu Sans'))
-                logger.info("Using font", font_path=self.font_path)
-            except ImportError:
-                logger.warning("Matplotlib not available, using default font")
-                self.font_path = None
+        # Font path for text rendering, resolved once per process
+        self.font_path = _resolve_font()
     
+    def warm_up(self) -> None:
+        """
+        Prime caches before the server accepts requests.
+
+        Idempotent and cheap to repeat: loads the settings once and
+        preloads the default font and its metrics so the first print
+        request does not pay the FreeType parse. Under a preloading WSGI
+        master this state is inherited by forked workers.
+        """
+        try:
+            settings = settings_service.get_settings()
+            if self.font_path:
+                font_size = int(settings.get("font_size", 50))
+                _get_font(self.font_path, font_size)
+                _get_font_metrics(self.font_path, font_size)
+            logger.debug("Printer service warmed up")
+        except Exception as e:
+            # Warm-up is best effort; the request path loads lazily anyway
+            logger.warning("Printer service warm-up failed", error=str(e))
+
     def get_printers(self) -> List[Dict[str, Any]]:
         """
         Get list of configured printers.
-        
+
         Returns:
             List of printer configurations.
         """
@@ -95,7 +394,7 @@ class PrinterService:
         """
         try:
             # Create a test connection to the printer
-            backend = backend_factory(guess_backend(printer_uri))["backend_class"](printer_uri)
+            backend = _backend_class(guess_backend(printer_uri))(printer_uri)
             
             # Try to get printer status (implementation depends on printer capabilities)
             # For now, we just check if we can establish a connection
@@ -147,33 +446,71 @@ class PrinterService:
         """
         try:
             # Generate a unique job ID
-            job_id = f"text_{uuid.uuid4().hex[:8]}"
+            job_id = _next_job_id("text")
             
             logger.info("Processing text print request", job_id=job_id, text_length=len(text))
             
             # Create label image
-            image_path = self._create_text_label(text, settings)
-            logger.info("Text label created", job_id=job_id, image_path=image_path)
-            
+            image = self._create_text_label(text, settings)
+            logger.info("Text label created", job_id=job_id)
+
             # Apply rotation if specified
             rotate = settings.get("rotate", 0)
             if rotate != 0:
-                image_path = self._apply_rotation(image_path, rotate)
+                image = _rotate_image(image, rotate)
                 logger.info("Rotation applied", job_id=job_id, rotate=rotate)
-            
-            # Send to printer
-            self._send_to_printer(image_path, settings)
-            logger.info("Print job completed successfully", job_id=job_id)
-            
+
+            # Queue for printing
+            self._queue_print(image, settings, job_id)
+
             return {
                 "success": True,
                 "job_id": job_id,
-                "message": "Text printed successfully"
+                "message": "Text print job submitted successfully"
             }
         except Exception as e:
             logger.error("Error printing text", error=str(e), exc_info=True)
             raise PrinterError(f"Error printing text: {str(e)}")
     
+    def print_text_batch(self, texts: List[str], settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Print several text labels that share one settings block.
+
+        The labels are queued back to back, so the print worker drains
+        them in batches over the persistent printer connection instead of
+        paying a connection setup per label. Duplicate entries are not
+        coalesced: listing the same text twice prints two labels.
+
+        Args:
+            texts: Texts to print, one label per entry.
+            settings: Dict containing print settings, shared by all labels.
+
+        Returns:
+            Dict containing the result of the batch submission.
+
+        Raises:
+            PrinterError: If there's an error submitting the batch.
+        """
+        try:
+            batch_id = _next_job_id("batch")
+            logger.info("Processing text batch print request", batch_id=batch_id, count=len(texts))
+
+            rotate = settings.get("rotate", 0)
+            for index, text in enumerate(texts):
+                image = self._create_text_label(text, settings)
+                if rotate != 0:
+                    image = _rotate_image(image, rotate)
+                self._queue_print(image, settings, f"{batch_id}_{index}", coalesce=False)
+
+            return {
+                "success": True,
+                "job_id": batch_id,
+                "message": f"Batch of {len(texts)} text print jobs submitted successfully"
+            }
+        except Exception as e:
+            logger.error("Error printing text batch", error=str(e), exc_info=True)
+            raise PrinterError(f"Error printing text batch: {str(e)}")
+
     def print_image(self, image_path: str, settings: Dict[str, Any]) -> Dict[str, Any]:
         """
         Print an image on a label.
@@ -192,201 +529,163 @@ class PrinterService:
         """
         try:
             # Generate a unique job ID
-            job_id = f"image_{uuid.uuid4().hex[:8]}"
+            job_id = _next_job_id("image")
             
             logger.info("Processing image print request", job_id=job_id, image_path=image_path)
             
-            # Resize image to fit label width
-            resized_path = self._resize_image(image_path)
-            logger.info("Image resized", job_id=job_id, resized_path=resized_path)
-            
+            # Resize image to fit label width (in memory)
+            image = self._prepare_image(image_path)
+            logger.info("Image resized", job_id=job_id)
+
             # Apply rotation if specified
             rotate = settings.get("rotate", 0)
             if rotate != 0:
-                resized_path = self._apply_rotation(resized_path, rotate)
+                image = _rotate_image(image, rotate)
                 logger.info("Rotation applied", job_id=job_id, rotate=rotate)
-            
-            # Send to printer
-            self._send_to_printer(resized_path, settings)
-            logger.info("Print job completed successfully", job_id=job_id)
-            
+
+            # Queue for printing
+            self._queue_print(image, settings, job_id)
+
             return {
                 "success": True,
                 "job_id": job_id,
-                "message": "Image printed successfully"
+                "message": "Image print job submitted successfully"
             }
         except Exception as e:
             logger.error("Error printing image", error=str(e), exc_info=True)
             raise PrinterError(f"Error printing image: {str(e)}")
     
-    def _create_text_label(self, html_text: str, settings: Dict[str, Any]) -> str:
+    def _create_text_label(self, html_text: str, settings: Dict[str, Any]) -> Image.Image:
         """
         Create a label image from HTML text.
-        
+
         Args:
             html_text: Text to print (can include HTML formatting).
             settings: Dict containing print settings.
-            
+
         Returns:
-            Path to the created image file.
-            
+            The rendered label image (kept in memory, never written to disk).
+
         Raises:
             ImageProcessingError: If there's an error creating the label.
         """
         try:
+            # Reuse the previously rendered label if the same text was
+            # already printed with identical render settings
+            font_size = int(settings.get("font_size", 50))
+            alignment = settings.get("alignment", "left")
+            cache_key = (html_text, font_size, alignment)
+            cached_image = self._text_label_cache.get(cache_key)
+            if cached_image is not None:
+                logger.debug("Reusing cached text label")
+                return cached_image
+
             # Parse HTML formatting (simplified for now)
-            from html.parser import HTMLParser
-            
-            class TextParser(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.parts = []
-                
-                def handle_starttag(self, tag, attrs):
-                    if tag == "br":
-                        self.parts.append("<br>")
-                
-                def handle_data(self, data):
-                    self.parts.append(data)
-                
-                def handle_endtag(self, tag):
-                    pass
-            
-            parser = TextParser()
-            parser.feed(html_text)
-            
-            # Process text parts
-            lines = []
-            current_line = []
-            for part in parser.parts:
-                if part == "<br>":
-                    lines.append("".join(current_line))
-                    current_line = []
-                else:
-                    current_line.append(part)
-            if current_line:
-                lines.append("".join(current_line))
-            
+            lines = _parse_label_lines(html_text)
+
             # Create image
             width = 696  # Fixed label width
-            font_size = int(settings.get("font_size", 50))
-            alignment = settings.get("alignment", "left")
-            
-            # Create a dummy image to calculate text dimensions
-            dummy_image = Image.new("RGB", (width, 10), "white")
-            dummy_draw = ImageDraw.Draw(dummy_image)
-            
-            # Calculate total height and line metrics
+
+            # Single layout pass: measure each line once and resolve its
+            # x position immediately, so the draw loop below only blits
             total_height = 10
             line_spacing = 5
             line_metrics = []
-            
+
+            # Alignment is fixed per label, so resolve the x computation
+            # once instead of re-comparing strings for every line
+            if alignment == "center":
+                x_of = lambda lw: (width - lw) // 2
+            elif alignment == "right":
+                x_of = lambda lw: width - lw - 10
+            else:
+                x_of = lambda lw: 10
+
+            font = _get_font(self.font_path, font_size)
             for line in lines:
-                font = ImageFont.truetype(self.font_path, font_size)
-                bbox = dummy_draw.textbbox((0, 0), line, font=font)
-                line_width = bbox[2] - bbox[0]
-                line_height = bbox[3] - bbox[1]
-                max_ascent, max_descent = font.getmetrics()
+                line_width, line_height = _measure_line(self.font_path, font_size, line)
                 total_height += line_height + line_spacing
-                line_metrics.append((line, max_ascent, max_descent, line_height, line_width))
-            
-            # Create the actual image
+                line_metrics.append((line, x_of(line_width), line_height))
+
+            # Create the actual image. Text labels are monochrome, so a
+            # single-channel canvas is a third of the RGB footprint and
+            # feeds straight into the 1-bit threshold.
             total_height += 10
-            image = Image.new("RGB", (width, total_height), "white")
+            image = Image.new("L", (width, total_height), 255)
             draw = ImageDraw.Draw(image)
-            
+
             # Draw text
             y = 10
-            for line_text, max_ascent, max_descent, line_height, line_width in line_metrics:
-                if alignment == "center":
-                    x = (width - line_width) // 2
-                elif alignment == "right":
-                    x = width - line_width - 10
-                else:
-                    x = 10
-                draw.text((x, y), line_text, font=font, fill="black")
+            for line_text, x, line_height in line_metrics:
+                draw.text((x, y), line_text, font=font, fill=0)
                 y += line_height + line_spacing
             
-            # Save image
-            image_path = os.path.join(self.upload_folder, f"text_label_{uuid.uuid4().hex[:8]}.png")
-            image.save(image_path)
-            
-            return image_path
+            # Cache the rendered label (bounded)
+            if len(self._text_label_cache) >= 32:
+                self._text_label_cache.pop(next(iter(self._text_label_cache)))
+            self._text_label_cache[cache_key] = image
+
+            return image
         except Exception as e:
             logger.error("Error creating text label", error=str(e), exc_info=True)
             raise ImageProcessingError(f"Error creating text label: {str(e)}")
     
-    def _resize_image(self, image_path: str) -> str:
+    def _prepare_image(self, image_path: str) -> Image.Image:
         """
-        Resize an image to fit the label width.
-        
+        Load an uploaded image and scale it to the label width in memory.
+
+        The decode, resize and any later rotation all operate on the same
+        in-memory image; nothing is re-encoded to disk between stages.
+
         Args:
-            image_path: Path to the image file.
-            
+            image_path: Path to the uploaded image file.
+
         Returns:
-            Path to the resized image file.
-            
+            The image, scaled to the label width.
+
         Raises:
-            ImageProcessingError: If there's an error resizing the image.
+            ImageProcessingError: If there's an error processing the image.
         """
         try:
             max_width = 696  # Fixed label width
-            
+
             with Image.open(image_path) as img:
+                # For JPEGs, let libjpeg decode at a reduced DCT scale
+                # (1/2, 1/4, 1/8) close to the target size instead of
+                # decoding megapixels we immediately throw away; no-op
+                # for other formats
+                img.draft("RGB", (max_width * 2, max_width * 2))
+
+                # Already at label width: nothing to resample
+                if img.width == max_width:
+                    img.load()
+                    return img
+
                 # Calculate new dimensions
                 aspect_ratio = img.height / img.width
                 new_height = int(max_width * aspect_ratio)
-                
-                # Resize image
-                img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Save resized image
-                filename = os.path.basename(image_path)
-                resized_path = os.path.join(self.upload_folder, f"resized_{filename}")
-                img.save(resized_path)
-                
-                return resized_path
+
+                # Resize image. Bilinear is roughly twice as fast as
+                # Lanczos here and the output is thresholded to 1-bit
+                # before printing anyway, so the extra kernel quality
+                # would be discarded.
+                return img.resize((max_width, new_height), Image.Resampling.BILINEAR, reducing_gap=2.0)
         except Exception as e:
             logger.error("Error resizing image", error=str(e), exc_info=True)
             raise ImageProcessingError(f"Error resizing image: {str(e)}")
-    
-    def _apply_rotation(self, image_path: str, angle: int) -> str:
-        """
-        Apply rotation to an image.
-        
-        Args:
-            image_path: Path to the image file.
-            angle: Rotation angle in degrees.
-            
-        Returns:
-            Path to the rotated image file.
-            
-        Raises:
-            ImageProcessingError: If there's an error rotating the image.
-        """
-        try:
-            with Image.open(image_path) as img:
-                # Apply rotation
-                rotated_img = img.rotate(-angle, resample=Image.Resampling.LANCZOS, expand=True)
-                
-                # Save rotated image
-                filename = os.path.basename(image_path)
-                rotated_path = os.path.join(self.upload_folder, f"rotated_{filename}")
-                rotated_img.save(rotated_path)
-                
-                return rotated_path
-        except Exception as e:
-            logger.error("Error rotating image", error=str(e), exc_info=True)
-            raise ImageProcessingError(f"Error rotating image: {str(e)}")
-    
-    def _send_to_printer(self, image_path: str, settings: Dict[str, Any]) -> None:
+
+    def _send_to_printer(self, image, settings: Dict[str, Any]) -> None:
         """
-        Send an image to the printer.
-        
+        Send one label or a batch of labels to the printer.
+
+        Batching several labels into one conversion emits a single
+        printer setup sequence instead of one per label.
+
         Args:
-            image_path: Path to the image file.
+            image: The label(s) to print; a PIL Image, a path to an
+                image file, or a list mixing both.
             settings: Dict containing print settings.
-            
+
         Raises:
             PrinterError: If there's an error sending to the printer.
         """
@@ -409,28 +708,70 @@ class PrinterService:
             if not label_size:
                 raise ValueError("label_size is required")
             
-            # Create rasterizer
-            qlr = BrotherQLRaster(printer_model)
-            qlr.exception_on_warning = True
-            
-            # Convert image to printer instructions
-            instructions = convert(
-                qlr=qlr,
-                images=[image_path],
-                label=label_size,
-                rotate=rotate,
-                threshold=threshold,
-                dither=dither,
-                compress=compress,
-                red=red,
+            images_in = image if isinstance(image, list) else [image]
+
+            # Reuse cached printer instructions when the same image(s)
+            # were already converted with identical settings
+            cache_key = (
+                tuple(_image_digest(i) for i in images_in),
+                printer_model, label_size, rotate, threshold, dither, compress, red,
             )
-            
+            instructions = self._raster_cache.get(cache_key)
+
+            if instructions is None:
+                # Create rasterizer
+                qlr = BrotherQLRaster(printer_model)
+                qlr.exception_on_warning = True
+
+                # Pre-threshold to 1-bit with numpy where possible; red
+                # labels and dithering need the original pixel data
+                if NUMPY_AVAILABLE and not dither and not red:
+                    images = [_binarize(i if isinstance(i, Image.Image) else Image.open(i), threshold)
+                              for i in images_in]
+                else:
+                    images = images_in
+
+                # Convert image to printer instructions
+                instructions = convert(
+                    qlr=qlr,
+                    images=images,
+                    label=label_size,
+                    rotate=rotate,
+                    threshold=threshold,
+                    dither=dither,
+                    compress=compress,
+                    red=red,
+                )
+
+                # Keep the cache bounded
+                if len(self._raster_cache) >= 64:
+                    self._raster_cache.pop(next(iter(self._raster_cache)))
+                self._raster_cache[cache_key] = instructions
+            else:
+                logger.debug("Reusing cached printer instructions")
+
             # Send to printer
-            backend = backend_factory(guess_backend(printer_uri))["backend_class"](printer_uri)
-            backend.write(instructions)
-            backend.dispose()
-            
-            logger.info("Print job sent to printer", 
+            backend_type = guess_backend(printer_uri)
+            if backend_type == "network":
+                # Reuse a persistent connection to the printer
+                with self._backend_lock:
+                    backend = self._get_backend(printer_uri)
+                    try:
+                        backend.write(instructions)
+                    except OSError:
+                        # Connection went stale (e.g. printer idled out);
+                        # reconnect once and retry
+                        logger.warning("Printer connection stale, reconnecting", printer_uri=printer_uri)
+                        self._close_backend()
+                        backend = self._get_backend(printer_uri)
+                        backend.write(instructions)
+            else:
+                # Non-network backends (USB, file) are opened per job
+                backend = _backend_class(backend_type)(printer_uri)
+                backend.write(instructions)
+                backend.dispose()
+
+            logger.info("Print job sent to printer",
                        printer_uri=printer_uri, 
                        printer_model=printer_model,
                        label_size=label_size)
@@ -438,6 +779,120 @@ class PrinterService:
             logger.error("Error sending to printer", error=str(e), exc_info=True)
             raise PrinterError(f"Error sending to printer: {str(e)}")
 
+    def _queue_print(self, image, settings: Dict[str, Any], job_id: str,
+                     coalesce: bool = True) -> None:
+        """
+        Queue a rendered label for transmission to the printer.
+
+        Args:
+            image: The label to print (PIL Image or path to an image file).
+            settings: Dict containing print settings.
+            job_id: Identifier of the print job (for logging).
+            coalesce: Drop the job if an identical one is already queued.
+                Batch submissions pass False, where duplicates are
+                intentional copies.
+        """
+        # Coalesce: if an identical job is already queued or printing,
+        # submitting it again would only produce a duplicate label
+        key = (_image_digest(image), str(sorted(settings.items())))
+        if not coalesce:
+            key = key + (job_id,)
+        with self._pending_lock:
+            if key in self._pending_jobs:
+                logger.info("Identical print job already in flight, coalescing", job_id=job_id)
+                return
+            self._pending_jobs.add(key)
+
+        self._print_queue.put((image, dict(settings), job_id, key))
+        logger.info("Print job queued", job_id=job_id, queue_size=self._print_queue.qsize())
+
+    def _print_worker_loop(self) -> None:
+        """Worker loop that sends queued print jobs to the printer."""
+        # Job already pulled off the queue whose settings did not match
+        # the previous batch; it seeds the next one so submission order
+        # is preserved (re-queueing would push it behind newer jobs)
+        carry_over = None
+        while True:
+            if carry_over is not None:
+                batch = [carry_over]
+                carry_over = None
+            else:
+                batch = [self._print_queue.get()]
+            settings = batch[0][1]
+
+            # Drain further jobs with identical settings so they share a
+            # single conversion and printer setup sequence
+            while len(batch) < 8:
+                try:
+                    next_job = self._print_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_job[1] == settings:
+                    batch.append(next_job)
+                else:
+                    # Different settings: hold it for the next iteration
+                    carry_over = next_job
+                    break
+
+            job_ids = [job[2] for job in batch]
+            try:
+                self._send_to_printer([job[0] for job in batch], settings)
+                logger.info("Print job batch completed successfully", job_ids=job_ids)
+            except Exception as e:
+                logger.error("Background print job failed",
+                            job_ids=job_ids,
+                            error=str(e),
+                            exc_info=True)
+            finally:
+                with self._pending_lock:
+                    for job in batch:
+                        self._pending_jobs.discard(job[3])
+                for job in batch:
+                    self._print_queue.task_done()
+
+    def _get_backend(self, printer_uri: str):
+        """
+        Return the persistent backend for the given printer URI.
+
+        Opens a new connection if none exists yet or the URI changed.
+        Must be called while holding self._backend_lock.
+
+        Args:
+            printer_uri: URI of the printer.
+
+        Returns:
+            An open backend instance.
+        """
+        if self._backend is not None and self._backend_uri == printer_uri:
+            return self._backend
+
+        self._close_backend()
+        self._backend = _backend_class(guess_backend(printer_uri))(printer_uri)
+        self._backend_uri = printer_uri
+
+        # Ask the kernel to probe the idle connection so half-open sockets
+        # (printer power-cycled, cable pulled) are detected and surface as
+        # OSError on the next write instead of hanging
+        sock = getattr(self._backend, "s", None)
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            except OSError as e:
+                logger.debug("Could not enable SO_KEEPALIVE", error=str(e))
+
+        logger.debug("Opened persistent printer connection", printer_uri=printer_uri)
+        return self._backend
+
+    def _close_backend(self) -> None:
+        """Dispose of the persistent printer connection, if any."""
+        if self._backend is not None:
+            try:
+                self._backend.dispose()
+            except Exception as e:
+                logger.debug("Error disposing printer connection", error=str(e))
+            self._backend = None
+            self._backend_uri = None
+
     def start_keep_alive(self, printer_uri: Optional[str] = None, printer_model: Optional[str] = None, interval: int = 60) -> Dict[str, Any]:
         """
         Start a background thread that periodically pings the printer to keep it from shutting down.
@@ -576,44 +1031,43 @@ class PrinterService:
         """
         try:
             # Generate a unique job ID
-            job_id = f"qrcode_{uuid.uuid4().hex[:8]}"
+            job_id = _next_job_id("qrcode")
             
             logger.info("Processing QR code print request", job_id=job_id, data_length=len(data))
             
             # Create QR code image
-            image_path = self._create_qr_code(data, settings)
-            logger.info("QR code created", job_id=job_id, image_path=image_path)
-            
+            image = self._create_qr_code(data, settings)
+            logger.info("QR code created", job_id=job_id)
+
             # Apply rotation if specified
             rotate = settings.get("rotate", 0)
             if rotate != 0:
-                image_path = self._apply_rotation(image_path, rotate)
+                image = _rotate_image(image, rotate)
                 logger.info("Rotation applied", job_id=job_id, rotate=rotate)
-            
-            # Send to printer
-            self._send_to_printer(image_path, settings)
-            logger.info("Print job completed successfully", job_id=job_id)
-            
+
+            # Queue for printing
+            self._queue_print(image, settings, job_id)
+
             return {
                 "success": True,
                 "job_id": job_id,
-                "message": "QR code printed successfully"
+                "message": "QR code print job submitted successfully"
             }
         except Exception as e:
             logger.error("Error printing QR code", error=str(e), exc_info=True)
             raise PrinterError(f"Error printing QR code: {str(e)}")
     
-    def _create_qr_code(self, data: str, settings: Dict[str, Any]) -> str:
+    def _create_qr_code(self, data: str, settings: Dict[str, Any]) -> Image.Image:
         """
         Create a QR code image.
         
         Args:
             data: The data to encode in the QR code.
             settings: Dict containing QR code settings.
-            
+
         Returns:
-            Path to the created QR code image file.
-            
+            The composed QR code image (kept in memory, never written to disk).
+
         Raises:
             ImageProcessingError: If there's an error creating the QR code.
         """
@@ -635,7 +1089,21 @@ class PrinterService:
             side_by_side = settings.get("side_by_side", False)  # Whether to show text and QR code side by side
             side_text = settings.get("side_text", "")  # Text to show on the side
             qr_position = settings.get("qr_position", "right")  # Position of QR code: "left" or "right"
-            
+
+            # Repeat prints of the same payload and layout reuse the
+            # composed image — QR generation plus compositing is the
+            # expensive half of a QR job (mirrors the text-label cache)
+            cache_key = (
+                data, show_text, text, qr_version, qr_box_size, qr_border,
+                error_correction, qr_size, text_position, text_alignment,
+                side_by_side, side_text, qr_position,
+                settings.get("text_font_size", settings.get("font_size", 30)),
+            )
+            cached_image = self._qr_label_cache.get(cache_key)
+            if cached_image is not None:
+                logger.debug("Reusing cached QR code image")
+                return cached_image
+
             # Map error correction string to qrcode constants
             error_correction_map = {
                 "L": qrcode.constants.ERROR_CORRECT_L,  # 7% error correction
@@ -654,23 +1122,41 @@ class PrinterService:
             )
             qr.add_data(data)
             qr.make(fit=True)
-            
-            # Create image
-            qr_img = qr.make_image(fill_color="black", back_color="white")
-            qr_img = qr_img.convert("RGB")
-            
+
+            # Render as close to the requested size as possible by scaling
+            # the box size to the module grid, so the LANCZOS resize below
+            # only has to bridge the sub-module remainder (and is skipped
+            # entirely when the grid divides the target size evenly)
+            if qr_size:
+                modules = qr.modules_count + 2 * qr_border
+                qr.box_size = max(1, qr_size // modules)
+
+            # Create image. make_image() draws each module as a PIL
+            # rectangle in a Python loop; with numpy available, expanding
+            # the module matrix with a single Kronecker product builds the
+            # whole raster in C instead. The label is monochrome end to
+            # end, so everything stays in single-channel 'L' mode — a
+            # third of the RGB bandwidth through resize and compose.
+            if NUMPY_AVAILABLE:
+                matrix = np.asarray(qr.get_matrix(), dtype=np.uint8)  # border included
+                block = np.ones((qr.box_size, qr.box_size), dtype=np.uint8)
+                raster = (1 - np.kron(matrix, block)) * 255
+                qr_img = Image.fromarray(raster, mode="L")
+            else:
+                qr_img = qr.make_image(fill_color="black", back_color="white")
+                qr_img = qr_img.convert("L")
+
             # Resize QR code to desired size if specified
-            qr_size = settings.get("qr_size", 400)  # Default to 400px for better visibility
             if qr_size:
                 # Get current size
                 current_width, current_height = qr_img.size
-                
+
                 # Calculate new size while maintaining aspect ratio
                 if current_width != qr_size:
                     ratio = qr_size / current_width
                     new_size = (qr_size, int(current_height * ratio))
                     qr_img = qr_img.resize(new_size, Image.Resampling.LANCZOS)
-                    logger.debug("Resized QR code", 
+                    logger.debug("Resized QR code",
                                original_size=(current_width, current_height),
                                new_size=new_size)
             
@@ -681,7 +1167,7 @@ class PrinterService:
                 
                 # Use text_font_size if provided, otherwise fall back to font_size or default
                 text_font_size = settings.get("text_font_size", settings.get("font_size", 30))
-                font = ImageFont.truetype(self.font_path, text_font_size)
+                font = _get_font(self.font_path, int(text_font_size))
                 
                 # Parse side_text into lines
                 side_text_lines = side_text.split('\n')
@@ -692,11 +1178,8 @@ class PrinterService:
                 total_text_height = 0
                 line_spacing = 10
                 
-                dummy_draw = ImageDraw.Draw(qr_img)
                 for line in side_text_lines:
-                    bbox = dummy_draw.textbbox((0, 0), line, font=font)
-                    line_width = bbox[2] - bbox[0]
-                    line_height = bbox[3] - bbox[1]
+                    line_width, line_height = _measure_line(self.font_path, int(text_font_size), line)
                     max_text_width = max(max_text_width, line_width)
                     text_metrics.append((line, line_width, line_height))
                     total_text_height += line_height + line_spacing
@@ -718,7 +1201,7 @@ class PrinterService:
                 
                 # Create a new image with the combined layout
                 total_height = max(qr_height, total_text_height) + padding * 2
-                new_img = Image.new("RGB", (total_width, total_height), "white")
+                new_img = Image.new("L", (total_width, total_height), 255)
                 
                 # Determine positions based on qr_position
                 if qr_position == "left":
@@ -747,7 +1230,7 @@ class PrinterService:
                     else:  # left alignment (default)
                         text_x = text_area_x
                     
-                    draw.text((text_x, text_y), line, font=font, fill="black")
+                    draw.text((text_x, text_y), line, font=font, fill=0)
                     text_y += line_height + line_spacing
                 
                 qr_img = new_img
@@ -756,72 +1239,42 @@ class PrinterService:
             elif show_text and text:
                 # Get QR code dimensions
                 qr_width, qr_height = qr_img.size
-                
-                # Create a new image with space for text
+
                 # Use text_font_size if provided, otherwise fall back to font_size or default
                 text_font_size = settings.get("text_font_size", settings.get("font_size", 30))
-                font = ImageFont.truetype(self.font_path, text_font_size)
-                
-                # Calculate text dimensions
-                dummy_draw = ImageDraw.Draw(qr_img)
-                bbox = dummy_draw.textbbox((0, 0), text, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                
-                # Create a new image with space for text
+                font = _get_font(self.font_path, int(text_font_size))
+
+                # Measure the caption once; only the vertical offsets
+                # differ between the top and bottom layouts
+                text_width, text_height = _measure_line(self.font_path, int(text_font_size), text)
                 padding = 20  # Padding between QR code and text
-                
-                # Determine layout based on text position
+
+                if text_alignment == "center":
+                    x = (qr_width - text_width) // 2
+                elif text_alignment == "right":
+                    x = qr_width - text_width - 10
+                else:  # left alignment
+                    x = 10
+
                 if text_position == "top":
-                    # Text above QR code
-                    new_height = qr_height + text_height + padding
-                    new_img = Image.new("RGB", (qr_width, new_height), "white")
-                    
-                    # Draw text at the top
-                    draw = ImageDraw.Draw(new_img)
-                    
-                    # Calculate text position based on alignment
-                    if text_alignment == "center":
-                        x = (qr_width - text_width) // 2
-                    elif text_alignment == "right":
-                        x = qr_width - text_width - 10
-                    else:  # left alignment
-                        x = 10
-                    
-                    y = padding // 2
-                    draw.text((x, y), text, font=font, fill="black")
-                    
-                    # Paste QR code below text
-                    new_img.paste(qr_img, (0, text_height + padding))
-                else:
-                    # Text below QR code (default)
-                    new_height = qr_height + text_height + padding
-                    new_img = Image.new("RGB", (qr_width, new_height), "white")
-                    
-                    # Paste QR code at the top
-                    new_img.paste(qr_img, (0, 0))
-                    
-                    # Draw text below QR code
-                    draw = ImageDraw.Draw(new_img)
-                    
-                    # Calculate text position based on alignment
-                    if text_alignment == "center":
-                        x = (qr_width - text_width) // 2
-                    elif text_alignment == "right":
-                        x = qr_width - text_width - 10
-                    else:  # left alignment
-                        x = 10
-                    
-                    y = qr_height + padding // 2
-                    draw.text((x, y), text, font=font, fill="black")
-                
+                    qr_y = text_height + padding
+                    text_y = padding // 2
+                else:  # text below QR code (default)
+                    qr_y = 0
+                    text_y = qr_height + padding // 2
+
+                new_img = Image.new("L", (qr_width, qr_height + text_height + padding), 255)
+                new_img.paste(qr_img, (0, qr_y))
+                ImageDraw.Draw(new_img).text((x, text_y), text, font=font, fill=0)
+
                 qr_img = new_img
-            
-            # Save QR code image
-            image_path = os.path.join(self.upload_folder, f"qrcode_{uuid.uuid4().hex[:8]}.png")
-            qr_img.save(image_path)
-            
-            return image_path
+
+            # Cache the composed image (bounded)
+            if len(self._qr_label_cache) >= 32:
+                self._qr_label_cache.pop(next(iter(self._qr_label_cache)))
+            self._qr_label_cache[cache_key] = qr_img
+
+            return qr_img
         except Exception as e:
             logger.error("Error creating QR code", error=str(e), exc_info=True)
             raise ImageProcessingError(f"Error creating QR code: {str(e)}")
@@ -851,24 +1304,25 @@ class PrinterService:
                 "error": str(e)
             }
     
-    def _extract_ip_from_uri(self, printer_uri: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _extract_ip_from_uri(printer_uri: str) -> str:
         """
         Extract IP address from printer URI.
-        
+
+        Memoized per URI: the keep-alive loop re-parses the same URI on
+        every tick, so after the first call this is a dict lookup.
+
         Args:
             printer_uri: URI of the printer (e.g., tcp://192.168.1.100).
-            
+
         Returns:
             IP address as a string.
         """
-        # Handle tcp:// format
-        if printer_uri.startswith("tcp://"):
-            ip_address = printer_uri[6:]
-            # Remove port if present
-            if ":" in ip_address:
-                ip_address = ip_address.split(":")[0]
-            return ip_address
-        
+        match = _TCP_URI_RE.match(printer_uri)
+        if match:
+            return match.group("ip")
+
         # Handle other formats or return as is if not recognized
         return printer_uri
     
@@ -893,17 +1347,28 @@ class PrinterService:
             return False
             
         try:
-            # Standard printer MIB - System Description
-            system_description_oid = '1.3.6.1.2.1.1.1.0'
-            
+            # Build the engine and request objects once; only the
+            # transport target varies, cached per printer address
+            if self._snmp_engine is None:
+                self._snmp_engine = SnmpEngine()
+                self._snmp_community = CommunityData('public')  # 'public' is the common default
+                self._snmp_context = ContextData()
+                # Standard printer MIB - System Description
+                self._snmp_object = ObjectType(ObjectIdentity('1.3.6.1.2.1.1.1.0'))
+
+            transport = self._snmp_transports.get(ip_address)
+            if transport is None:
+                transport = UdpTransportTarget((ip_address, 161), timeout=2.0, retries=1)
+                self._snmp_transports[ip_address] = transport
+
             # Create an SNMP GET request
             error_indication, error_status, error_index, var_binds = next(
                 getCmd(
-                    SnmpEngine(),
-                    CommunityData('public'),  # SNMP community string, 'public' is common default
-                    UdpTransportTarget((ip_address, 161), timeout=2.0, retries=1),
-                    ContextData(),
-                    ObjectType(ObjectIdentity(system_description_oid))
+                    self._snmp_engine,
+                    self._snmp_community,
+                    transport,
+                    self._snmp_context,
+                    self._snmp_object
                 )
             )
             
@@ -933,10 +1398,14 @@ class PrinterService:
     def _tcp_ping(self, ip_address: str) -> bool:
         """
         Send a TCP ping to the printer.
-        
+
+        All candidate ports are probed concurrently with non-blocking
+        connects and one select loop, so a dead host costs a single
+        2-second timeout instead of one per port.
+
         Args:
             ip_address: IP address of the printer.
-            
+
         Returns:
             True if successful, False otherwise.
         """
@@ -950,45 +1419,48 @@ class PrinterService:
                     port = int(ip_parts[1])
                 except (ValueError, IndexError):
                     pass
-            
-            # Try to connect to the specific port first
+
+            # Probe the configured port plus the standard printer ports
+            # (RAW, LPR, IPP) in parallel
+            ports = [port] + [p for p in (9100, 515, 631) if p != port]
+
+            sel = selectors.DefaultSelector()
+            sockets = []
+            open_port = None
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2.0)
-                result = sock.connect_ex((ip_address, port))
-                sock.close()
-                
-                if result == 0:
-                    logger.debug("TCP ping successful on specific port", ip_address=ip_address, port=port)
-                    return True
-            except Exception as specific_error:
-                logger.debug("TCP ping failed on specific port", 
-                           ip_address=ip_address, 
-                           port=port, 
-                           error=str(specific_error))
-            
-            # If specific port fails, try common printer ports
-            printer_ports = [9100, 515, 631]  # Standard printer ports (RAW, LPR, IPP)
-            
-            # Remove the specific port we already tried
-            if port in printer_ports:
-                printer_ports.remove(port)
-            
-            for alt_port in printer_ports:
-                try:
+                for candidate in ports:
                     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(2.0)
-                    result = sock.connect_ex((ip_address, alt_port))
-                    sock.close()
-                    
+                    sock.setblocking(False)
+                    result = sock.connect_ex((ip_address, candidate))
                     if result == 0:
-                        logger.debug("TCP ping successful on alternative port", 
-                                   ip_address=ip_address, 
-                                   port=alt_port)
-                        return True
-                except Exception:
-                    continue
-            
+                        open_port = candidate
+                        sock.close()
+                        break
+                    if result == errno.EINPROGRESS:
+                        sel.register(sock, selectors.EVENT_WRITE, candidate)
+                        sockets.append(sock)
+                    else:
+                        sock.close()
+
+                deadline = time.monotonic() + 2.0
+                while open_port is None and sel.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in sel.select(timeout=remaining):
+                        sel.unregister(key.fileobj)
+                        if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            open_port = key.data
+                            break
+            finally:
+                for sock in sockets:
+                    sock.close()
+                sel.close()
+
+            if open_port is not None:
+                logger.debug("TCP ping successful", ip_address=ip_address, port=open_port)
+                return True
+
             logger.warning("TCP ping failed on all ports", ip_address=ip_address)
             return False
         except Exception as e:
@@ -1022,68 +1494,74 @@ class PrinterService:
             logger.info("Keep alive worker exiting: backend is not 'network'", printer_uri=printer_uri, backend=backend_type)
             return
         
-        logger.info("Keep alive worker started", 
-                   printer_uri=printer_uri, 
-                   printer_model=printer_model,
-                   interval=interval)
-        
         # Extract IP address from printer URI
         ip_address = self._extract_ip_from_uri(printer_uri)
-        logger.info("Extracted IP address for keep alive", 
-                   printer_uri=printer_uri, 
-                   ip_address=ip_address)
-        
+
+        # The static context never changes for the lifetime of this
+        # worker; bind it once so each log call in the loop only carries
+        # its per-event fields instead of rebuilding the full dict
+        log = logger.bind(printer_uri=printer_uri, ip_address=ip_address)
+
+        log.info("Keep alive worker started",
+                 printer_model=printer_model,
+                 interval=interval)
+
         # Track consecutive failures to implement exponential backoff
         consecutive_failures = 0
         max_backoff = 300  # Maximum backoff in seconds (5 minutes)
-        
+
+        # Wake-ups are scheduled against absolute monotonic deadlines so
+        # the cadence does not drift by the duration of the pings
+        next_deadline = time.monotonic()
+
         while not stop_event.is_set():
             try:
-                # Calculate backoff time based on consecutive failures
-                if consecutive_failures > 0:
-                    # Exponential backoff with a maximum
-                    backoff_time = min(interval * (2 ** consecutive_failures), max_backoff)
-                    logger.warning("Using backoff due to consecutive failures", 
-                                  consecutive_failures=consecutive_failures,
-                                  backoff_time=backoff_time)
-                    # Wait for the backoff time or until stopped
-                    if stop_event.wait(backoff_time - interval):  # Subtract interval because we'll wait again at the end
+                log.debug("Sending keep alive ping")
+
+                # A plain TCP connect is the cheapest "is the printer
+                # awake" probe (one socket, no ASN.1 engine), so the
+                # default order is TCP, then SNMP, then a full backend
+                # connect. Whichever probe answered last time is tried
+                # first on later ticks, so a printer that only speaks one
+                # protocol costs a single attempt in steady state.
+                order = ["tcp", "snmp", "backend"]
+                pref = self._ping_pref.get(ip_address)
+                if pref in order:
+                    order.remove(pref)
+                    order.insert(0, pref)
+
+                winner = None
+                for method in order:
+                    if method == "tcp":
+                        if self._tcp_ping(ip_address):
+                            winner = method
+                    elif method == "snmp":
+                        if self._snmp_ping(ip_address):
+                            winner = method
+                    else:
+                        # Connect with the original URI. This is important
+                        # for Docker environments where host.docker.internal
+                        # might be used to access the host network.
+                        log.debug("Falling back to original keep alive method")
+                        try:
+                            backend = _backend_class(guess_backend(printer_uri))(printer_uri)
+                            # Just establishing and closing a connection might be enough
+                            log.debug("Connection established as keep-alive ping")
+                            backend.dispose()
+                            winner = method
+                        except Exception as backend_error:
+                            log.warning("Original keep alive method failed",
+                                        error=str(backend_error))
+                    if winner:
                         break
-                
-                logger.debug("Sending keep alive ping", ip_address=ip_address)
-                
-                # Try SNMP ping first (for all addresses including host.docker.internal)
-                if self._snmp_ping(ip_address):
-                    logger.debug("SNMP keep alive ping successful", ip_address=ip_address)
-                    consecutive_failures = 0
-                # Fall back to TCP ping if SNMP fails
-                elif self._tcp_ping(ip_address):
-                    logger.debug("TCP keep alive ping successful", ip_address=ip_address)
+
+                if winner is not None:
+                    log.debug("Keep alive ping successful", method=winner)
+                    self._ping_pref[ip_address] = winner
                     consecutive_failures = 0
-                # If both fail, try the original method with the full printer_uri
                 else:
-                    logger.debug("Falling back to original keep alive method", printer_uri=printer_uri)
-                    try:
-                        # Create a connection to the printer using the original URI
-                        # This is important for Docker environments where host.docker.internal
-                        # might be used to access the host network
-                        backend = backend_factory(guess_backend(printer_uri))["backend_class"](printer_uri)
-                        
-                        # Just establishing and closing a connection might be enough
-                        logger.debug("Connection established as keep-alive ping", printer_uri=printer_uri)
-                        
-                        # Close the connection
-                        backend.dispose()
-                        consecutive_failures = 0
-                    except Exception as backend_error:
-                        logger.warning("Original keep alive method failed", 
-                                   printer_uri=printer_uri,
-                                   error=str(backend_error))
-                        # Don't raise the error, just increment the failure counter
-                        consecutive_failures += 1
-                        continue
-                
-                logger.debug("Keep alive ping successful", printer_uri=printer_uri)
+                    # All probes failed; back off below
+                    consecutive_failures += 1
             except Exception as e:
                 # Increment consecutive failures for backoff
                 consecutive_failures += 1
@@ -1091,23 +1569,30 @@ class PrinterService:
                 # Log at warning level instead of error to reduce log noise
                 log_level = "error" if consecutive_failures <= 3 else "warning"
                 if log_level == "error":
-                    logger.error("Error in keep alive ping", 
-                               printer_uri=printer_uri,
-                               ip_address=ip_address,
-                               error=str(e),
-                               consecutive_failures=consecutive_failures,
-                               exc_info=True)
+                    log.error("Error in keep alive ping",
+                              error=str(e),
+                              consecutive_failures=consecutive_failures,
+                              exc_info=True)
                 else:
-                    logger.warning("Error in keep alive ping (repeated)", 
-                                 printer_uri=printer_uri,
-                                 ip_address=ip_address,
-                                 error=str(e),
-                                 consecutive_failures=consecutive_failures)
-            
-            # Wait for the next interval or until stopped
-            stop_event.wait(interval)
-        
-        logger.info("Keep alive worker stopped", printer_uri=printer_uri)
+                    log.warning("Error in keep alive ping (repeated)",
+                                error=str(e),
+                                consecutive_failures=consecutive_failures)
+            
+            # One wait covers both the regular cadence and failure
+            # backoff; a late ping never causes a catch-up burst because
+            # the deadline is clamped to now before advancing
+            if consecutive_failures > 0:
+                delay = min(interval * (2 ** consecutive_failures), max_backoff)
+                log.warning("Using backoff due to consecutive failures",
+                            consecutive_failures=consecutive_failures,
+                            backoff_time=delay)
+            else:
+                delay = interval
+            next_deadline = max(next_deadline, time.monotonic()) + delay
+            if stop_event.wait(next_deadline - time.monotonic()):
+                break
+
+        log.info("Keep alive worker stopped")
 
 # Create a singleton instance
 printer_service = PrinterService()
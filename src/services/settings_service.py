@@ -10,9 +10,17 @@ import copy  # For deepcopy
 from typing import Dict, Any, Optional
 from brother_ql.backends import guess_backend
 
+# Use orjson for settings (de)serialization when available; it parses and
+# serializes in C and is significantly faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Attempt to import default settings, handle potential import errors during startup phases
 try:
-    from src.config.default_settings import DEFAULT_SETTINGS
+    from src.config.default_settings import DEFAULT_SETTINGS, get_defaults
 except ImportError:
     logger = structlog.get_logger()
     logger.error("Failed to import DEFAULT_SETTINGS. Using fallback defaults.")
@@ -25,8 +33,48 @@ except ImportError:
         "printers": [{"id": "default", "name": "Default Printer", "printer_uri": "tcp://192.168.1.100", "printer_model": "QL-800", "label_size": "62"}]
     }
 
+    def get_defaults():
+        return copy.deepcopy(DEFAULT_SETTINGS)
+
 logger = structlog.get_logger()
 
+def _dumps(settings: Dict[str, Any]) -> bytes:
+    """Serialize settings to pretty-printed JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=4, ensure_ascii=False).encode("utf-8")
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _clone(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep-copy a JSON-shaped settings dict.
+
+    Settings only ever contain JSON types, so an orjson round-trip (two
+    C passes) replaces copy.deepcopy's per-object type dispatch and memo
+    bookkeeping; falls back to deepcopy without orjson.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(orjson.dumps(settings))
+    return copy.deepcopy(settings)
+
+# Validation tables built once at import instead of per call
+_TYPE_CHECKS = {
+    "printer_uri": str, "printer_model": str, "label_size": str,
+    "font_size": (int, float), "alignment": str, "rotate": (int, float),
+    "threshold": (int, float), "dither": bool, "compress": bool, "red": bool,
+    "keep_alive_enabled": bool, "keep_alive_interval": (int, float),
+    "printers": list
+}
+_REQUIRED_FIELDS = frozenset(("printer_uri", "printer_model", "label_size"))
+_VALID_ALIGNMENTS = frozenset(("left", "center", "right"))
+_VALID_ROTATIONS = frozenset((0, 90, 180, 270))
+_PRINTER_REQUIRED_FIELDS = frozenset(("id", "printer_uri", "printer_model", "label_size"))
+
 class SettingsService:
     """
     Manages application settings, loading from and saving to a JSON file.
@@ -46,6 +94,15 @@ class SettingsService:
         else:
             self.settings_file = settings_file
 
+        # Serialized form of the last settings written to disk, used to
+        # skip rewriting the file when nothing changed
+        self._last_saved: Optional[bytes] = None
+
+        # Parsed settings cache, invalidated via the file's stat signature
+        # so repeat loads cost one stat() instead of a read + JSON parse
+        self._cached_settings: Optional[Dict[str, Any]] = None
+        self._cached_stat: Optional[tuple] = None
+
         self.settings: Dict[str, Any] = self._load_settings()
         logger.info("SettingsService initialized", initial_settings_source=self.settings_file)
 
@@ -55,28 +112,42 @@ class SettingsService:
         If the file doesn't exist or is invalid, returns default settings.
         """
         try:
-            if os.path.exists(self.settings_file):
-                logger.debug("Attempting to load settings from file", file=self.settings_file)
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                # Basic check if it's a dictionary
-                if not isinstance(loaded_settings, dict):
-                     raise ValueError("Loaded settings are not a dictionary.")
-                logger.info("Successfully loaded settings from file", file=self.settings_file)
-                # Ensure all default keys are present (add missing ones)
-                # This prevents errors if new settings are added to defaults later
-                updated_settings = copy.deepcopy(DEFAULT_SETTINGS)
-                updated_settings.update(loaded_settings) # Overwrite defaults with loaded values
-                return updated_settings
-            else:
+            # A missing file surfaces as FileNotFoundError from os.stat,
+            # saving a separate exists() stat on every load
+            try:
+                stat = os.stat(self.settings_file)
+            except FileNotFoundError:
                 logger.warning("Settings file not found, using default settings", file=self.settings_file)
-                return copy.deepcopy(DEFAULT_SETTINGS)
+                return get_defaults()
+
+            # Serve from the parsed cache while the file is unchanged
+            stat_sig = (stat.st_mtime_ns, stat.st_size)
+            if self._cached_settings is not None and self._cached_stat == stat_sig:
+                return _clone(self._cached_settings)
+
+            logger.debug("Attempting to load settings from file", file=self.settings_file)
+            with open(self.settings_file, 'rb') as f:
+                loaded_settings = _loads(f.read())
+            # Basic check if it's a dictionary
+            if not isinstance(loaded_settings, dict):
+                 raise ValueError("Loaded settings are not a dictionary.")
+            logger.info("Successfully loaded settings from file", file=self.settings_file)
+            # Ensure all default keys are present (add missing ones)
+            # This prevents errors if new settings are added to defaults later
+            updated_settings = get_defaults()
+            updated_settings.update(loaded_settings) # Overwrite defaults with loaded values
+
+            # Cache the merged result; hand out copies so callers
+            # cannot mutate the cached dict
+            self._cached_settings = updated_settings
+            self._cached_stat = stat_sig
+            return _clone(updated_settings)
         except (json.JSONDecodeError, ValueError, IOError) as e:
             logger.error("Error loading or parsing settings file, using defaults", file=self.settings_file, error=str(e), exc_info=True)
-            return copy.deepcopy(DEFAULT_SETTINGS)
+            return get_defaults()
         except Exception as e:
             logger.error("Unexpected error loading settings, using defaults", file=self.settings_file, error=str(e), exc_info=True)
-            return copy.deepcopy(DEFAULT_SETTINGS)
+            return get_defaults()
 
     def _validate_settings(self, settings_to_validate: Dict[str, Any]) -> None:
         """
@@ -88,32 +159,25 @@ class SettingsService:
         if not isinstance(settings_to_validate, dict):
              raise ValueError("Settings must be a dictionary.")
 
-        type_checks = {
-            "printer_uri": str, "printer_model": str, "label_size": str,
-            "font_size": (int, float), "alignment": str, "rotate": (int, float),
-            "threshold": (int, float), "dither": bool, "compress": bool, "red": bool,
-            "keep_alive_enabled": bool, "keep_alive_interval": (int, float),
-            "printers": list
-        }
-        for field, expected_type in type_checks.items():
+        for field, expected_type in _TYPE_CHECKS.items():
             # Check type only if the field exists in the dictionary being validated
             if field in settings_to_validate and not isinstance(settings_to_validate[field], expected_type):
                  raise ValueError(f"Invalid type for setting '{field}': Expected {expected_type}, got {type(settings_to_validate[field])}")
 
         # --- Required Fields ---
-        required_fields = ["printer_uri", "printer_model", "label_size"]
-        for field in required_fields:
-            if field not in settings_to_validate:
-                raise ValueError(f"Missing required setting: {field}")
+        missing = _REQUIRED_FIELDS.difference(settings_to_validate)
+        if missing:
+            raise ValueError(f"Missing required setting: {sorted(missing)[0]}")
+        for field in _REQUIRED_FIELDS:
             # Ensure required fields are not empty strings
             if isinstance(settings_to_validate[field], str) and not settings_to_validate[field].strip():
                 raise ValueError(f"Required setting '{field}' cannot be empty.")
 
         # --- Value Checks ---
-        if "alignment" in settings_to_validate and settings_to_validate["alignment"] not in ["left", "center", "right"]:
+        if "alignment" in settings_to_validate and settings_to_validate["alignment"] not in _VALID_ALIGNMENTS:
             raise ValueError(f"Invalid alignment value: {settings_to_validate['alignment']}")
 
-        if "rotate" in settings_to_validate and settings_to_validate["rotate"] not in [0, 90, 180, 270]:
+        if "rotate" in settings_to_validate and settings_to_validate["rotate"] not in _VALID_ROTATIONS:
              raise ValueError(f"Invalid rotate value: {settings_to_validate['rotate']}. Must be 0, 90, 180, or 270.")
 
         if "threshold" in settings_to_validate and not (0 <= settings_to_validate["threshold"] <= 100):
@@ -138,10 +202,10 @@ class SettingsService:
             for i, printer in enumerate(settings_to_validate["printers"]):
                 if not isinstance(printer, dict):
                     raise ValueError(f"Item at index {i} in 'printers' list must be a dictionary.")
-                printer_required_fields = ["id", "printer_uri", "printer_model", "label_size"]
-                for field in printer_required_fields:
-                    if field not in printer:
-                        raise ValueError(f"Printer at index {i} missing required field: {field}")
+                missing_fields = _PRINTER_REQUIRED_FIELDS.difference(printer)
+                if missing_fields:
+                    raise ValueError(f"Printer at index {i} missing required field: {sorted(missing_fields)[0]}")
+                for field in _PRINTER_REQUIRED_FIELDS:
                     if isinstance(printer[field], str) and not printer[field].strip():
                          raise ValueError(f"Required field '{field}' in printer at index {i} cannot be empty.")
         logger.debug("Settings validation passed")
@@ -169,23 +233,41 @@ class SettingsService:
                 logger.error("Settings validation failed before save", error=str(ve), invalid_settings=settings_to_save)
                 return False
 
-            # 2. Ensure the target directory exists
+            # 2. Serialize once and skip the write if nothing changed
+            data = _dumps(settings_to_save)
+            if data == self._last_saved:
+                logger.debug("Settings unchanged, skipping write", file=self.settings_file)
+                return True
+
+            # 3. Ensure the target directory exists
             os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
 
-            # 3. Write to temporary file
+            # 4. Write to temporary file
             logger.debug("Writing settings to temporary file", temp_file=temp_file_path)
-            with open(temp_file_path, 'w', encoding='utf-8') as f:
-                json.dump(settings_to_save, f, indent=4, ensure_ascii=False)
+            with open(temp_file_path, 'wb') as f:
+                f.write(data)
                 f.flush()
                 os.fsync(f.fileno()) # Force write to disk
             logger.debug("Successfully wrote and synced temporary file", temp_file=temp_file_path)
 
-            # 4. Atomically replace the original file
+            # 5. Atomically replace the original file
             logger.debug("Attempting to replace original file with temporary file", source=temp_file_path, dest=self.settings_file)
             os.replace(temp_file_path, self.settings_file)
+            self._last_saved = data
             logger.debug("Successfully replaced original file", file=self.settings_file)
 
-            # 5. In-memory state update is removed. State will be re-read from file on next access.
+            # 6. Refresh the parsed cache from what we just wrote, so the
+            # first read after a save skips the re-read and re-parse
+            try:
+                stat = os.stat(self.settings_file)
+                merged = get_defaults()
+                # Clone so later caller-side mutation cannot poison the cache
+                merged.update(_clone(settings_to_save))
+                self._cached_settings = merged
+                self._cached_stat = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                self._cached_settings = None
+                self._cached_stat = None
             logger.info("Settings saved successfully to file", file=self.settings_file)
             return True
 
@@ -242,8 +324,9 @@ class SettingsService:
             current_settings_from_file = self._load_settings()
             logger.debug("Loaded current settings from file before update", loaded_settings=current_settings_from_file)
 
-            # Create a deep copy to modify
-            merged_settings = copy.deepcopy(current_settings_from_file)
+            # _load_settings already returned a private copy, but clone
+            # defensively so validation failures cannot leak partial merges
+            merged_settings = _clone(current_settings_from_file)
             # Merge the updates
             merged_settings.update(settings_update)
             logger.debug("Merged settings prepared for saving", merged_settings=merged_settings)
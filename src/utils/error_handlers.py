@@ -2,6 +2,8 @@
 Error handlers for the application.
 """
 
+import functools
+import logging
 import structlog
 from typing import Dict, Any, Tuple
 from werkzeug.exceptions import HTTPException
@@ -18,97 +20,87 @@ from utils.exceptions import (
 
 logger = structlog.get_logger()
 
+# Used for cheap level checks before computing expensive log arguments;
+# structlog's stdlib-backed loggers honor the same effective level
+_stdlib_logger = logging.getLogger(__name__)
+
+def log_and_reraise(wrapper_cls, message):
+    """
+    Decorator for controller entry points.
+
+    Logs and re-raises known application errors, and wraps anything
+    unexpected in wrapper_cls with the given message. Replaces the
+    identical except-cascade previously copied into every controller.
+
+    Args:
+        wrapper_cls: AppError subclass used to wrap unexpected exceptions.
+        message: Log/wrap message describing the failed operation.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except AppError as e:
+                logger.error(type(e).__name__, error=str(e), exc_info=True)
+                raise
+            except Exception as e:
+                logger.error(message, error=str(e), exc_info=True)
+                raise wrapper_cls(f"{message}: {str(e)}")
+        return wrapper
+    return decorator
+
+# Client-disconnect exceptions arrive in storms when callers drop
+# connections mid-response; they carry no actionable traceback, so the
+# catch-all handler answers them with a canned payload and a cheap
+# debug log instead of formatting a stack trace per occurrence
+_QUIET_TYPES = (ConnectionResetError, BrokenPipeError, TimeoutError)
+_QUIET_RESPONSE = {
+    "code": "INTERNAL_SERVER_ERROR",
+    "message": "An unexpected error occurred",
+    "details": {}
+}
+
+# There are only a few dozen distinct HTTP statuses, so the code strings
+# the HTTP/Connexion handlers put in their payloads are precomputed once
+# instead of re-formatted per response
+_HTTP_CODES = {status: f"HTTP_{status}" for status in range(400, 600)}
+_CONNEXION_CODES = {status: f"CONNEXION_{status}" for status in range(400, 600)}
+
+# Application error handlers share one shape: log, then return the
+# error's own payload. One (class, log message, level, status) table and
+# a single factory replace the six hand-written closures; subclasses
+# must precede AppError so Flask matches the most specific entry.
+_APP_ERROR_TABLE = (
+    (ValidationError, "Validation error", "warning", 400),
+    (ResourceNotFoundError, "Resource not found", "warning", 404),
+    (PrinterError, "Printer error", "error", 500),
+    (ImageProcessingError, "Image processing error", "error", 500),
+    (ConfigurationError, "Configuration error", "error", 500),
+    (AppError, "Application error", "error", 500),
+)
+
+def _make_app_error_handler(log_message: str, level: str, status: int):
+    """Build a handler returning an AppError's payload with the given status."""
+    log = getattr(logger, level)
+
+    def handler(error: AppError) -> Tuple[Dict[str, Any], int]:
+        log(log_message, **error._log_kwargs)
+        return error.to_dict(), status
+
+    return handler
+
 def register_error_handlers(app):
     """
     Register error handlers for the application.
-    
+
     Args:
         app: Flask application.
     """
-    @app.errorhandler(ValidationError)
-    def handle_validation_error(error: ValidationError) -> Tuple[Dict[str, Any], int]:
-        """
-        Handle validation errors.
-        
-        Args:
-            error: ValidationError instance.
-            
-        Returns:
-            Tuple of error response and status code.
-        """
-        logger.warning("Validation error", error=str(error), details=error.details)
-        return error.to_dict(), 400
-    
-    @app.errorhandler(ResourceNotFoundError)
-    def handle_resource_not_found_error(error: ResourceNotFoundError) -> Tuple[Dict[str, Any], int]:
-        """
-        Handle resource not found errors.
-        
-        Args:
-            error: ResourceNotFoundError instance.
-            
-        Returns:
-            Tuple of error response and status code.
-        """
-        logger.warning("Resource not found", error=str(error), details=error.details)
-        return error.to_dict(), 404
-    
-    @app.errorhandler(PrinterError)
-    def handle_printer_error(error: PrinterError) -> Tuple[Dict[str, Any], int]:
-        """
-        Handle printer errors.
-        
-        Args:
-            error: PrinterError instance.
-            
-        Returns:
-            Tuple of error response and status code.
-        """
-        logger.error("Printer error", error=str(error), details=error.details)
-        return error.to_dict(), 500
-    
-    @app.errorhandler(ImageProcessingError)
-    def handle_image_processing_error(error: ImageProcessingError) -> Tuple[Dict[str, Any], int]:
-        """
-        Handle image processing errors.
-        
-        Args:
-            error: ImageProcessingError instance.
-            
-        Returns:
-            Tuple of error response and status code.
-        """
-        logger.error("Image processing error", error=str(error), details=error.details)
-        return error.to_dict(), 500
-    
-    @app.errorhandler(ConfigurationError)
-    def handle_configuration_error(error: ConfigurationError) -> Tuple[Dict[str, Any], int]:
-        """
-        Handle configuration errors.
-        
-        Args:
-            error: ConfigurationError instance.
-            
-        Returns:
-            Tuple of error response and status code.
-        """
-        logger.error("Configuration error", error=str(error), details=error.details)
-        return error.to_dict(), 500
-    
-    @app.errorhandler(AppError)
-    def handle_app_error(error: AppError) -> Tuple[Dict[str, Any], int]:
-        """
-        Handle generic application errors.
-        
-        Args:
-            error: AppError instance.
-            
-        Returns:
-            Tuple of error response and status code.
-        """
-        logger.error("Application error", error=str(error), details=error.details)
-        return error.to_dict(), 500
-    
+    for exc_class, log_message, level, status in _APP_ERROR_TABLE:
+        app.register_error_handler(
+            exc_class, _make_app_error_handler(log_message, level, status))
+
     @app.errorhandler(ProblemException)
     def handle_connexion_problem(error: ProblemException) -> Tuple[Dict[str, Any], int]:
         """
@@ -122,7 +114,7 @@ def register_error_handlers(app):
         """
         logger.warning("Connexion problem", error=str(error), status=error.status)
         return {
-            "code": f"CONNEXION_{error.status}",
+            "code": _CONNEXION_CODES.get(error.status) or f"CONNEXION_{error.status}",
             "message": str(error),
             "details": error.detail if hasattr(error, 'detail') else {}
         }, error.status
@@ -140,7 +132,7 @@ def register_error_handlers(app):
         """
         logger.warning("HTTP exception", error=str(error), code=error.code)
         return {
-            "code": f"HTTP_{error.code}",
+            "code": _HTTP_CODES.get(error.code) or f"HTTP_{error.code}",
             "message": error.description,
             "details": {}
         }, error.code
@@ -156,7 +148,14 @@ def register_error_handlers(app):
         Returns:
             Tuple of error response and status code.
         """
-        logger.error("Unhandled exception", error=str(error), exc_info=True)
+        if isinstance(error, _QUIET_TYPES):
+            logger.debug("Client connection error", error_type=type(error).__name__)
+            return _QUIET_RESPONSE, 500
+
+        # str(error) and the exc_info traceback capture are only worth
+        # paying for when ERROR records are actually emitted
+        if _stdlib_logger.isEnabledFor(logging.ERROR):
+            logger.error("Unhandled exception", error=str(error), exc_info=True)
         return {
             "code": "INTERNAL_SERVER_ERROR",
             "message": "An unexpected error occurred",
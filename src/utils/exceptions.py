@@ -2,9 +2,20 @@
 Custom exceptions for the Brother QL Printer App.
 """
 
+# Shared empty details dict for errors raised without field/resource
+# context — the common shape for message-only raises. Treat to_dict()
+# output as read-only; mutating this sentinel would leak into every
+# detail-less error.
+_EMPTY_DETAILS: dict = {}
+
 class AppError(Exception):
     """Base exception for all application errors."""
-    
+
+    # With slots, attribute writes never materialize the lazy instance
+    # __dict__ Exception subclasses otherwise allocate — worthwhile for
+    # validation-heavy endpoints that raise these per bad request
+    __slots__ = ("message", "code", "details", "_dict", "_log_kwargs")
+
     def __init__(self, message: str, code: str = None, details: dict = None):
         """
         Initialize the exception.
@@ -16,40 +27,55 @@ class AppError(Exception):
         """
         self.message = message
         self.code = code or self.__class__.__name__.upper()
-        self.details = details or {}
+        # 'is None' rather than truthiness so the shared empty sentinel
+        # passed by subclasses is kept instead of replaced with a fresh dict
+        self.details = details if details is not None else {}
+        # Response payload built once; every error handler calls
+        # to_dict exactly once per response, and details is shared by
+        # reference so later mutations stay visible
+        self._dict = {
+            "code": self.code,
+            "message": self.message,
+            "details": self.details
+        }
+        # Log context assembled at raise time so the error handler only
+        # unpacks one prebuilt dict instead of rebuilding the kwargs
+        self._log_kwargs = {
+            "error": self.message,
+            "code": self.code,
+            "details": self.details
+        }
         super().__init__(self.message)
-    
+
     def to_dict(self) -> dict:
         """
         Convert the exception to a dictionary.
-        
+
         Returns:
             Dict representation of the exception.
         """
-        return {
-            "code": self.code,
-            "message": self.message,
-            "details": self.details
-        }
+        return self._dict
 
 
 class PrinterError(AppError):
     """Exception raised for printer-related errors."""
-    pass
+    __slots__ = ()
 
 
 class ImageProcessingError(AppError):
     """Exception raised for image processing errors."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(AppError):
     """Exception raised for configuration errors."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(AppError):
     """Exception raised for validation errors."""
+
+    __slots__ = ()
     
     def __init__(self, message: str, field: str = None, details: dict = None):
         """
@@ -60,6 +86,11 @@ class ValidationError(AppError):
             field: Field that failed validation.
             details: Additional error details.
         """
+        if details is None and field is None:
+            # No per-error context: share the empty sentinel instead of
+            # allocating a dict per raise
+            super().__init__(message, "VALIDATION_ERROR", _EMPTY_DETAILS)
+            return
         details = details or {}
         if field:
             details["field"] = field
@@ -68,6 +99,8 @@ class ValidationError(AppError):
 
 class ResourceNotFoundError(AppError):
     """Exception raised when a requested resource is not found."""
+
+    __slots__ = ()
     
     def __init__(self, message: str, resource_type: str = None, resource_id: str = None, details: dict = None):
         """
@@ -79,6 +112,9 @@ class ResourceNotFoundError(AppError):
             resource_id: ID of the resource that was not found.
             details: Additional error details.
         """
+        if details is None and resource_type is None and resource_id is None:
+            super().__init__(message, "RESOURCE_NOT_FOUND", _EMPTY_DETAILS)
+            return
         details = details or {}
         if resource_type:
             details["resource_type"] = resource_type
@@ -2,11 +2,13 @@
 Patch for compatibility with newer versions of Pillow.
 """
 
+import functools
 import PIL.Image
 import logging
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
 def apply_pillow_patch():
     """
     Apply patch for compatibility with newer versions of Pillow.
@@ -14,6 +16,9 @@ def apply_pillow_patch():
     In newer versions of Pillow, Image.ANTIALIAS is deprecated and replaced with
     Image.Resampling.LANCZOS. This patch adds the ANTIALIAS attribute to the Image
     module if it doesn't exist.
+
+    Cached so repeated calls (once per worker, plus the __main__ path)
+    probe and patch the PIL module dict only once per process.
     """
     if not hasattr(PIL.Image, 'ANTIALIAS'):
         logger.info("Applying Pillow patch: Adding ANTIALIAS attribute")